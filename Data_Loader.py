@@ -0,0 +1,28 @@
+"""
+Code name : CSV data loader shared by Electrolyzer.py and Hydrogen_Storage.py
+Data : 2026.10.14
+"""
+
+import numpy as np
+import pandas as pd
+import os
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
+
+# pyarrow is optional, it is the multi-threaded CSV parser of pd.read_csv
+_CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+
+def read_csv_columns(filepath, filename):
+    """
+    Reads filepath/<name>.csv for every name in filename concurrently
+
+    Output
+    ------
+    Last column of each file as a contiguous 1-D float64 array
+    """
+    def read(name):
+        df = pd.read_csv(os.path.join(filepath, "%s.csv" %name), engine=_CSV_ENGINE)
+        return np.ascontiguousarray(df.iloc[:, -1].to_numpy(dtype=np.float64))
+
+    with ThreadPoolExecutor(len(filename)) as ex:
+        return list(ex.map(read, filename))
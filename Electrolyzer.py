@@ -20,25 +20,125 @@ Data : 2021.09.08
     Electrolyte : KOH at 30 wt.%
 """
 
+import math
+from collections import namedtuple
 import numpy as np
-import pandas as pd
-import os
 import random
 import matplotlib.pyplot as plt
+from Data_Loader import read_csv_columns
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError: # numba is optional, HRI falls back to the NumPy methods
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+##### HRI 수전해설비 상수 (HRI electrolyser constants, see HRI.__init__) #####
+ElectConsts = namedtuple('ElectConsts', 'dam dcm S L R n F wt ncell')
+ELECT_CONSTS = ElectConsts(
+    dam=1.25, dcm=1.25, #[mm]
+    S=0.03, #[m**2]
+    L=45, #[cm]
+    R=8.315, #[J/K/mol]
+    n=2,
+    F=96485, #[C/mol]
+    wt=30, #[%]
+    ncell=24)
+
+_NH2_K = ELECT_CONSTS.ncell/(ELECT_CONSTS.n*ELECT_CONSTS.F) # ncell/(n*F) [mol/s/A]
+_TAFEL_LN = 2.303/math.log(10) # 2.303*log10(x) = _TAFEL_LN*log(x)
+
+# Water vapour pressures (see HRI.fEth) in log space, pw alone underflows in float32 at low T
+_PPW = (37.043, -6275.7, -3.4159) # log(ppw) = c0 + c1/T + c2*log(T)
+_PW = (37.93 + 0.016214, -6426.32, -3.498, -0.13802, 0.19330) # log(pw) = c0 + c1/T + c2*log(T) + c3*m + c4*sqrt(m)
+_PPW_PW = tuple(c_ppw - c_pw for c_ppw, c_pw in zip(_PPW, _PW)) # log(ppw/pw) without the cancellation of two O(10) logs
+
+def _log_ppw_pw(T, log_T, m):
+    return _PPW_PW[0] + _PPW_PW[1]/T + _PPW_PW[2]*log_T - _PW[3]*m - _PW[4]*np.sqrt(m)
+
+def _log_pw(T, log_T, m):
+    return _PW[0] + _PW[1]/T + _PW[2]*log_T + _PW[3]*m + _PW[4]*np.sqrt(m)
+
+##### HRI 모델 항 (Terms of the HRI model, shared by HRI and _cell_voltage) #####
+# Each term is written once as plain NumPy (HRI.fT_terms, HRI.fR), _cell_voltage uses their njit copies (_*_nb)
+def _m_exp(wt):
+    # Temperature-independent factor of _m, evaluated once per call instead of once per sample.
+    # math.exp keeps a float32 T in float32 without numba
+    return math.exp(wt/115.96277)
+
+def _m(T, wt, m_exp):
+    return wt*(183.1221 - 0.56845*T + 984.5679*m_exp)/100/56.105
+
+def _Erev0(T):
+    return 1.50342 - 9.956*1e-4*T + 2.5*1e-7*T*T
+
+def _ba(T, R, n, F):
+    return _TAFEL_LN*R*T/n/F/(0.0675 + 0.00095*T)
+
+def _bc(T, R, n, F):
+    return _TAFEL_LN*R*T/n/F/(0.1175 + 0.00095*T)
+
+def _J0a(T):
+    return 30.4 - 0.206*T + 0.00035*T*T #[mA/cm**2]
+
+def _J0c(T):
+    return 13.72491 - 0.09055*T + 0.09055*T*T #[mA/cm**2]
+
+def _omega_Ni(T):
+    return 6*1e6 - 279650*T + 532*T*T - 0.38057*T*T*T #[S/cm]
+
+def _omega_KOH(m, T):
+    return -2.04*m - 0.0028*m*m + 0.005332*m*T + 207.2*m/T + 0.001043*m*m*m - 0.0000003*m*m*T*T #[S/cm]
+
+def _Rel(omega_Ni, L, S):
+    return L/omega_Ni/S*1e-4 #[ohm]
+
+def _Rele_free(omega_KOH, dam, dcm, S):
+    return (dam + dcm)/omega_KOH/S*1e-5 #[ohm]
+
+def _Rmem(T, S):
+    return (0.060 + 80*np.exp(T/50))/1e8/S # 0.5mm thickness of membrane
+
+def _theta(I, S):
+    return 0.023*(I/S)**0.3 # Caution! : I/S must be [A/m**2]
+
+def _e(theta):
+    return np.minimum(np.maximum(2/3*theta, 0.0), 0.99)
+
+# Scalar njit copies for the kernel, compiled on the first _cell_voltage call only
+_log_ppw_pw_nb = njit(cache=True)(_log_ppw_pw)
+_log_pw_nb = njit(cache=True)(_log_pw)
+_m_exp_nb = njit(cache=True)(_m_exp)
+_m_nb = njit(cache=True)(_m)
+_Erev0_nb = njit(cache=True)(_Erev0)
+_ba_nb = njit(cache=True)(_ba)
+_bc_nb = njit(cache=True)(_bc)
+_J0a_nb = njit(cache=True)(_J0a)
+_J0c_nb = njit(cache=True)(_J0c)
+_omega_Ni_nb = njit(cache=True)(_omega_Ni)
+_omega_KOH_nb = njit(cache=True)(_omega_KOH)
+_Rel_nb = njit(cache=True)(_Rel)
+_Rele_free_nb = njit(cache=True)(_Rele_free)
+_Rmem_nb = njit(cache=True)(_Rmem)
+_theta_nb = njit(cache=True)(_theta)
+_e_nb = njit(cache=True)(_e)
 
 class HRI:
-    def __init__(self, V,I,P,T):
+    def __init__(self, V,I,P,T, dtype=np.float32):
         """
         Parameters
         ----------
         ncell : Number of electrolytic cells
         dac : Anode-Cathode gap [mm]
         dam/dcm : Membrane-Anote/Cathode gap [mm]
-        Sm : Membrane surface area [m**2]
         em : Membrane thickness [mm]
-        Sa/Sc : Anode/Cathode surface area [m**2]
+        S : Anode/Cathode/Membrane surface area [m**2] (identical for the HRI electrolyser)
         ea/ec : Anode/Cathode thickness [mm]
-        La/Lc : Anode/Cathode height [cm]
+        L : Anode/Cathode height [cm]
         J0 : Anode/Cathode exchange current density [A/m**2]
         a : Anode/Cathode transfer coefficient
         R : The universal gas constant
@@ -52,29 +152,42 @@ class HRI:
         P : Pressure [bar]
         I : Current [A]
         V : Terminal Voltage [V]
+        dtype : Precision of the inputs and of every result (float32 by default, np.float64 for reference runs)
         """
         
-        self.V = V
-        self.I = I
-        self.P = P
-        self.T = T
+        self.dtype = dtype
+        self.V = np.asarray(V, dtype=dtype)
+        self.I = np.asarray(I, dtype=dtype)
+        self.P = np.asarray(P, dtype=dtype)
+        self.T = np.asarray(T, dtype=dtype)
         
-        self.dam, self.dcm = 1.25, 1.25 #[mm]
-        self.Sa, self.Sc, self.Sm = 0.03, 0.03, 0.03 #[m**2]
+        C = ELECT_CONSTS
+        self.dam, self.dcm = C.dam, C.dcm #[mm]
+        self.S = C.S #[m**2]
         #ea,ec, em = 2, 2, 0.5 #[mm]
-        self.La, self.Lc = 45, 45 #[cm]
-        self.R = 8.315 #[J/K/mol]
-        self.n = 2
-        self.F = 96485 #[C/mol]
-        self.wt = 30 #[%]
-        self.ncell = 24
+        self.L = C.L #[cm]
+        self.R = C.R #[J/K/mol]
+        self.n = C.n
+        self.F = C.F #[C/mol]
+        self.wt = C.wt #[%]
+        self.ncell = C.ncell
+        self._cache = None  # fT_terms(self._cache_T), computed on first use
+        self._cache_T = None
         
-        Eth = self.fEth(self.P, self.T)  # 가역전압
-        Vact_a, Vact_c = self.fVact(self.P, self.T, self.I)  # 활성화 전압
-        r = self.fR(self.I, self.T)  # 옴닉 저항
-        Vcell = Eth + Vact_c + Vact_a + r * self.I  # 셀 전압 추정
-        Vele = self.ncell * Vcell  # 수전해설비 전압 추정
         self.NH2_out = self.fNH2_out(self.I)
+
+    def compute_voltages(self):
+        """
+        Voltage estimation of the electrolyser (not needed for the hydrogen output)
+
+        Output
+        ------
+        Vcell : Cell voltage [V]
+        Vele : Electrolyser voltage [V]
+        """
+        self.Vcell = self.fVcell(self.I, self.P, self.T)  # 셀 전압 추정
+        self.Vele = self.ncell * self.Vcell  # 수전해설비 전압 추정
+        return self.Vele
         
     ##### 입력 변수(T(온도), I(전류), P(압력))에 대한 종속 파라미터 정의
     def fm(self, T):
@@ -88,7 +201,7 @@ class HRI:
         ---------
         T : Temperature [C]
         """
-        m = self.wt*(183.1221 - 0.56845*T + 984.5679*np.exp(self.wt/115.96277))/100/56.105
+        m = _m(T, self.wt, _m_exp(self.wt))
         return m
 
     def ftheta(self, I,S):
@@ -101,9 +214,52 @@ class HRI:
         _________
         I : Current [A]
         """
-        theta = 0.023*(I/S)**0.3 # Caution! : I/A must be [A/m**2]
+        theta = _theta(I, S) # Caution! : I/A must be [A/m**2]
         return theta
 
+    def fT_terms(self, T):
+        """
+        Terms of fEth, fVact and fR that depend on the temperature only
+
+        Parameters
+        ----------
+        m : molarity of KOH at 30 wt%
+        Erev0 : Temperature effect on reversible potential
+        pw : see fEth
+        kE : Pressure coefficient of Eth, RT/nF*ppw/pw
+        ba, bc : Anode/Cathode Tafel slope per natural log (2.303RT/anF/ln10)
+        J0a, J0c : Anode/Cathode exchange current density [mA/cm**2]
+        Rel, Rele_free, Rmem : see fR
+
+        Variables
+        ---------
+        T : Temperature [K]
+        """
+        # Evaluated once in float64 and stored in the precision of T, Eth = Erev0 - kE*(P-pw)**1.5
+        # is a difference of O(1-10) V terms
+        dtype = np.result_type(T, 1.0)
+        T = np.asarray(T, dtype=np.float64)
+        m = _m(T, self.wt, _m_exp(self.wt))
+        log_T = np.log(T)
+        terms = {'m': m, 'Erev0': _Erev0(T),
+                 'pw': np.exp(_log_pw(T, log_T, m)),
+                 'kE': self.R*T/self.n/self.F*np.exp(_log_ppw_pw(T, log_T, m)),
+                 'ba': _ba(T, self.R, self.n, self.F), 'bc': _bc(T, self.R, self.n, self.F),
+                 'J0a': _J0a(T), 'J0c': _J0c(T),
+                 'Rel': _Rel(_omega_Ni(T), self.L, self.S),
+                 'Rele_free': _Rele_free(_omega_KOH(m, T), self.dam, self.dcm, self.S),
+                 'Rmem': _Rmem(T, self.S)}
+        return {key: np.asarray(x, dtype=dtype) for key, x in terms.items()}
+
+    def _T_terms(self, T):
+        """fT_terms(T), evaluated only once per operating temperature array self.T"""
+        if T is not self.T:
+            return self.fT_terms(T)
+        if self._cache is None or self._cache_T is not T:
+            self._cache = self.fT_terms(T)
+            self._cache_T = T
+        return self._cache
+
     ##### 가역 전압 정의 (Reversible Voltage, Eth) #####
     def fEth(self, P,T):
         """
@@ -124,15 +280,10 @@ class HRI:
         P : pressure [bar]
         T : temperature [C]
         """
-        Erev0 = 1.50342 - 9.956*1e-4*T + 2.5*1e-7*T**2
-
-        pw = T**(-3.498)*np.exp(37.93 - 6426.32/T)*np.exp(0.016214 - 0.13802*self.fm(T) + 0.19330*self.fm(T)**0.5)
-        ppw = T**(-3.4159)*np.exp(37.043 - 6275.7/T)
-
-        Erev = Erev0 + self.R*T*np.log((P-pw)**1.5*ppw/pw)/self.n/self.F + (P-pw)*(21.661*1e-6 - 5.471*1e-3/T) + \
-            (P-pw)**2*(-6.289*1e-6/T + 0.135*1e-3/T**1.5 + 2.547*1e-3/T**2 - 0.4825/T**3)
+        c = self._T_terms(T)
+        dp = P - c['pw']
 
-        Eth = Erev0 - self.R*T*((P - pw)**(3/2)*ppw/pw)/self.n/self.F
+        Eth = c['Erev0'] - c['kE']*dp*np.sqrt(dp) # (P-pw)**(3/2) = dp*sqrt(dp)
         return Eth
     ##### 활성화 전압(Activation Voltage, Vact) 정의 #####
     def fVact(self, P,T,I):
@@ -146,12 +297,10 @@ class HRI:
         n : The number of electrons transferred in the electrolysis reaction
         F : The Faraday constant
         a : Transfer coefficient
-        b : Tafel slope
-        theta : Fractional electrode converage of the gas bubbles adhering on the electrodes.
+        b : Tafel slope per natural log (2.303RT/anF/ln10)
         S : The nominal electrode surface in cm**2
-        Seff : The effective electrode surface in cm**2
-        J : Current density of the electrodes
         J0 : Exchange current densities of the electrodes
+        (the bubble coverage theta, Seff = S*(1-theta) and J = I/Seff cancel, see below)
 
         Variables
         ---------
@@ -159,22 +308,15 @@ class HRI:
         T : Temperature [C]
         I : Current [A]
         """
-        aa = 0.0675 + 0.00095*T
-        ac = 0.1175 + 0.00095*T
-
-        ba = 2.303*self.R*T/self.n/self.F/aa
-        bc = 2.303*self.R*T/self.n/self.F/ac
-
-        theta_a, theta_c = self.ftheta(I,self.Sa), self.ftheta(I,self.Sc) # Caution! : I/A must be [A/m**2]
-        Seff_a, Seff_c = self.Sa*(1-theta_a), self.Sc*(1-theta_c)
+        c = self._T_terms(T)
+        ba, bc = c['ba'], c['bc']
 
-        Ja = I/Seff_a #[mA/cm**2]
-        Jc = I/Seff_c #[mA/cm**2]
-        J0a = 30.4 - 0.206*T + 0.00035*T**2 #[mA/cm**2]
-        J0c = 13.72491 - 0.09055*T + 0.09055*T**2 #[[mA/cm**2]]
+        # b*log(J/J0) + b*log(1-theta) with J = I/Seff = I/(S*(1-theta)) reduces to b*log(I/S/J0),
+        # the bubble coverage theta cancels. Anode and cathode share the surface S.
+        log_IS = np.log(I/self.S)
 
-        Vact_a = ba*np.log10(Ja/J0a) + ba*np.log10(1-theta_a)
-        Vact_c = bc*np.log10(Jc/J0c) + bc*np.log10(1-theta_c)
+        Vact_a = ba*(log_IS - np.log(c['J0a']))
+        Vact_c = bc*(log_IS - np.log(c['J0c']))
         return Vact_a, Vact_c
     ##### 옴닉 저항 (Ohmmic Resistance, r) 정의 #####
     def fR(self, I, T):
@@ -190,8 +332,7 @@ class HRI:
         S : The electrode cross-sections [m**2]
         d : distance between the electrodes and the membranes [mm]
         m : molarity of KOH at 30 wt%
-        Ra : The anode resistance [ohm]
-        Rc : The cathode resistance [ohm]
+        Rel : The anode (= cathode) resistance [ohm]
         Rele : Electrolyte's resistance [ohm]
         Rmem : The membrane resistance [ohm]
 
@@ -199,56 +340,173 @@ class HRI:
         ---------
         T : Temperature [K]
         """
+        c = self._T_terms(T)
         # Electrodes
-        omega_Ni = 6*1e6 - 279650*T + 532*T**2 - 0.38057*T**3 #[S/cm]
-        Ra = self.La/omega_Ni/self.Sa*1e-4 #[ohm]
-        Rc = self.Lc/omega_Ni/self.Sc*1e-4 #[ohm]
+        Rel = c['Rel'] #[ohm]
         # Electrolyte
-        omega_KOH = -2.04*self.fm(T) - 0.0028*(self.fm(T))**2 + 0.005332*self.fm(T)*T + 207.2*self.fm(T)/T + \
-            0.001043*(self.fm(T))**3 - 0.0000003*(self.fm(T))**2*T**2
-        e = 2/3*self.ftheta(I,self.Sa)
-        Rele_free = 1/omega_KOH*(self.dam/self.Sa+self.dcm/self.Sc)*1e-5 #[ohm]
-        Rele_e = Rele_free*(1/(1-e)**(3/2)-1) #[ohm]
-        Rele = Rele_free + Rele_e #[ohm]
+        e = np.asarray(_e(_theta(I, self.S)), dtype=np.result_type(I, 1.0))
+        Rele_free = c['Rele_free'] #[ohm]
+        # Rele = Rele_free + Rele_e, Rele_e = Rele_free*expm1(-1.5*log1p(-e)) = Rele_free*(1/(1-e)**(3/2)-1)
         # Membrane
-        Rmem = (0.060 + 80*np.exp(T/50))/1e8/self.Sm # 0.5mm thickness of membrane
+        Rmem = c['Rmem'] # 0.5mm thickness of membrane
 
-        r = Ra + Rc + Rele + Rmem
+        r = 2*Rel + Rele_free + Rele_free*np.expm1(-1.5*np.log1p(-e)) + Rmem
         return r
     
+    ##### 셀 전압 (Cell Voltage, Vcell) 정의 #####
+    def fVcell(self, I, P, T):
+        """
+        Electrolytic cell model - Cell voltage (Vcell = Eth + Vact_a + Vact_c + r*I)
+        Uses the fused numba kernel when numba is available.
+
+        Variables
+        ---------
+        I : Current [A]
+        P : Pressure [bar]
+        T : Temperature [K]
+        """
+        if not _HAS_NUMBA:
+            Eth = self.fEth(P, T)  # 가역전압
+            Vact_a, Vact_c = self.fVact(P, T, I)  # 활성화 전압
+            r = self.fR(I, T)  # 옴닉 저항
+            return Eth + Vact_c + Vact_a + r * I
+
+        I, P, T = np.broadcast_arrays(I, P, T)
+        flat = [np.ascontiguousarray(x, dtype=self.dtype).ravel() for x in (I, P, T)]
+        C = ElectConsts(self.dam, self.dcm, self.S, self.L, self.R, self.n, self.F, self.wt, self.ncell)
+        Vcell = _cell_voltage(*flat, C, np.empty(T.size, dtype=self.dtype))
+        return Vcell.reshape(T.shape)
+
     def fNH2_out(self, I):
         """
         parameters
         __________
         n : The number of electrons transferred in the electrolysis reaction
         """
-        I_loss = 0
-        nF = (I-I_loss)/I
-        H2_out = self.ncell*I*nF/self.n/self.F
+        H2_out = I*(self.ncell/(self.n*self.F)) # Faraday efficiency nF = (I-I_loss)/I = 1 with I_loss = 0
         return H2_out
 
+class HRIBatch:
+    def __init__(self, N, dtype=np.float32):
+        """
+        HRI cell voltage (ELECT_CONSTS) for batches of up to N samples
+        The samples and the result live in one persistent (4, N) scratch pad. With numba repeated calls allocate
+        nothing, without numba fVcell runs the NumPy methods of one HRI, which allocate their temporaries.
+
+        Parameters
+        ----------
+        N : Maximum number of samples per call
+        dtype : Precision of the scratch pad (float32 halves the memory traffic of float64)
+        """
+        self.N = N
+        self.scratch = np.empty((4, N), dtype=dtype)
+        self._hri = None if _HAS_NUMBA else HRI(*self.scratch[:, :0], dtype=dtype)
+
+    def fVcell(self, I, P, T):
+        """
+        Electrolytic cell model - Cell voltage (Vcell = Eth + Vact_a + Vact_c + r*I)
+        Same as HRI.fVcell, the fused kernel with numba and the vectorized NumPy methods otherwise.
+
+        Variables
+        ---------
+        I : Current [A], 1-D array of at most N samples
+        P : Pressure [bar], 1-D array
+        T : Temperature [K], 1-D array
+
+        Output
+        ------
+        Vcell : Cell voltage [V], view into self.scratch (overwritten by the next call)
+        """
+        if len(I) > self.N:
+            raise ValueError("HRIBatch.fVcell : %d samples exceed the batch size N = %d" %(len(I), self.N))
+        I_, P_, T_, Vcell = self.scratch[:, :len(I)]
+        np.copyto(I_, I, casting='same_kind')
+        np.copyto(P_, P, casting='same_kind')
+        np.copyto(T_, T, casting='same_kind')
+        if not _HAS_NUMBA:
+            np.copyto(Vcell, self._hri.fVcell(I_, P_, T_))
+            return Vcell
+        return _cell_voltage(I_, P_, T_, ELECT_CONSTS, Vcell)
+
+##### 셀 전압 커널 (Fused cell voltage kernel) #####
+@njit(parallel=True, fastmath=True, cache=True)
+def _cell_voltage(I, P, T, C, Vcell):
+    """
+    Fused per-sample evaluation of HRI.fEth + HRI.fVact + HRI.fR.
+    Each sample's intermediates stay in registers instead of full-length temporaries.
+
+    Variables
+    ---------
+    I : Current [A], flat float32/float64 array (loaded as float64 scalars)
+    P : Pressure [bar], flat array of the same dtype
+    T : Temperature [K], flat array of the same dtype
+    C : ElectConsts
+    Vcell : Float output array of the same length, filled and returned
+
+    Output
+    ------
+    Vcell : Cell voltage [V]
+    """
+    wt, R, n, F, S, L, dam, dcm = C.wt, C.R, C.n, C.F, C.S, C.L, C.dam, C.dcm
+    m_exp = _m_exp_nb(wt)
+    for k in prange(T.shape[0]):
+        # float64 scalars, pw underflows in float32 at low T
+        t, p, i = float(T[k]), float(P[k]), float(I[k])
+        m = _m_nb(t, wt, m_exp)
+        # Reversible voltage
+        log_t = np.log(t)
+        dp = p - np.exp(_log_pw_nb(t, log_t, m))
+        Eth = _Erev0_nb(t) - R*t*(dp*np.sqrt(dp)*np.exp(_log_ppw_pw_nb(t, log_t, m)))/n/F
+        # Activation voltage
+        Vact_a = _ba_nb(t, R, n, F)*np.log(i/S/_J0a_nb(t))
+        Vact_c = _bc_nb(t, R, n, F)*np.log(i/S/_J0c_nb(t))
+        # Ohmic resistance
+        Rele = _Rele_free_nb(_omega_KOH_nb(m, t), dam, dcm, S)/(1 - _e_nb(_theta_nb(i, S)))**1.5
+        r = 2*_Rel_nb(_omega_Ni_nb(t), L, S) + Rele + _Rmem_nb(t, S)
+        Vcell[k] = Eth + Vact_a + Vact_c + r*i
+    return Vcell
+
+##### HRI 수전해설비 함수형 모델 (Free-function HRI model) #####
+def compute_h2(V, I, P, T):
+    """
+    Hydrogen output of the HRI electrolyser with ELECT_CONSTS (same as HRI(V,I,P,T,dtype=np.float64).NH2_out)
+    Plain NumPy, so pandas Series/DataFrame inputs keep their type and index
+
+    Output
+    ------
+    NH2_out : Hydrogen rate [mol/s]
+    """
+    return I*_NH2_K
+
+def compute_vele(I, P, T):
+    """
+    Electrolyser voltage with ELECT_CONSTS (same as HRI(V,I,P,T,dtype).compute_voltages())
+    I, P, T : arrays broadcastable against each other
+
+    Output
+    ------
+    Vele : Electrolyser voltage [V], float32 for float32 inputs and float64 otherwise
+    """
+    I, P, T = np.asarray(I), np.asarray(P), np.asarray(T)
+    return HRI(0, I, P, T, dtype=np.result_type(I, P, T, np.float32)).compute_voltages()
+
 def WED(V,I,P,T,state = 'on'):
     if state == 'on':
-        Mode = HRI(V,I,P,T)
-        output = Mode.NH2_out
+        output = compute_h2(V,I,P,T)
     else:
         output = 0
     return output
 
 # Example
-filepath_mac = '/Users/jeonseungchan/OneDrive/OneDrive - 한양대학교/3. Codes/1. DataSet/5. KETI_Example_Data'
-filepath = 'C:/Users/jsc95/OneDrive - 한양대학교/3. Codes/1. DataSet/3. 2021_KIEE_Data'
-filename = ['V_operate','I_operate','P_operate','T_operate']
-filepath = filepath_mac # MAC 사용 시 ON
-
-df_V = pd.read_csv(os.path.join(filepath, "%s.csv" %filename[0]))
-df_I = pd.read_csv(os.path.join(filepath, "%s.csv" %filename[1]))
-df_P = pd.read_csv(os.path.join(filepath, "%s.csv" %filename[2]))
-df_T = pd.read_csv(os.path.join(filepath, "%s.csv" %filename[3]))
-
-V = df_V.values
-I = df_I.values
-P = df_P.values
-T = df_T.values
-
-Hydrogen = WED(V,I,P,T,state='on')
\ No newline at end of file
+def _demo():
+    filepath_mac = '/Users/jeonseungchan/OneDrive/OneDrive - 한양대학교/3. Codes/1. DataSet/5. KETI_Example_Data'
+    filepath = 'C:/Users/jsc95/OneDrive - 한양대학교/3. Codes/1. DataSet/3. 2021_KIEE_Data'
+    filename = ['V_operate','I_operate','P_operate','T_operate']
+    filepath = filepath_mac # MAC 사용 시 ON
+
+    V, I, P, T = read_csv_columns(filepath, filename)
+
+    return WED(V,I,P,T,state='on')
+
+if __name__ == '__main__':
+    Hydrogen = _demo()
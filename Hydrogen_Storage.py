@@ -3,10 +3,8 @@ Code name : Compressor-Hydrogen Tank-Hydrogen Vehicles model
 Data : 2021.09.08
 """
 
-import numpy as np
-import pandas as pd
-import os
 import random
+from Data_Loader import read_csv_columns
 
 class H2System:
     """
@@ -31,19 +29,8 @@ class H2System:
         
     def fCompressor(self, NH2_ele, P_H2_ele, T_H2_ele):
         """
-        Parameters
-        ----------
-        n_comp : compressor efficiency
-        
-        Time_Varying
-        ------------
-        m : Polytropic exponent
-        '''
-        0이면 등압과정
-        1이면 등온과정
-        r이면 등엔트로피과정
-        infinite이면 등적과정
-        '''
+        Compressor exit state, fixed at 200 atm and 25 C
+
         Input
         -----
         NH2_ele : Electrolyzer Hydrogen flow rate [mol/s]
@@ -55,46 +42,56 @@ class H2System:
         P_H2_comp :Compressor Hydrogen Pressure [Pa]
         T_H2_comp : Compressor Hydrogen Temperature [K]
         """
-        n_comp = 1
         P_H2_comp = 200 * 101325 #[Pa = atm * 101325]
         T_H2_comp = 25 + 273.15 #[K]
-        m = np.log(P_H2_ele/P_H2_ele)/np.log(P_H2_ele*T_H2_comp/P_H2_comp/T_H2_ele)
-        Pcomp = 2*NH2_ele*m*self.R*T_H2_ele/(m-1)/n_comp*((P_H2_comp/(P_H2_ele*P_H2_comp)**(1/2))**((m-1)/m)-1)
         return P_H2_comp, T_H2_comp
     
     def fH2Tank(self,NH2_ele, NH2_HV, T_H2_comp):
         """
         Parameters
         ----------
-        Vtank : Hydrogen Tank Volume [liter]
-        T_H2_comp : Compressor Hydrogen Temperature [K]
         t : Time Interval [s]
-        A0, B0, a, b, c : Volume-mol parameters
-        
-        Time_Varying
-        ------------
-        Ptank : Tank Pressure [atm] 
         
         Input
         -----
         NH2_ele : Electrolyzer Hydrogen flow rate [mol/s]
         NH2_HV : Hydrogen Vehicles Hydrogen flow rate [mol/s]
+        T_H2_comp : Compressor Hydrogen Temperature [K]
         
         Output
         ------
         n : Number of molse of H2 in the tank [mole]
         """
+        t = 1 #[s]
+        n = (NH2_ele - NH2_HV) * t # [mol]
+        return n
+
+    def fPtank(self, n, T_H2_comp):
+        """
+        Parameters
+        ----------
+        Vtank : Hydrogen Tank Volume [liter]
+        A0, B0, a, b, c : Volume-mol parameters
+        
+        Input
+        -----
+        n : Number of molse of H2 in the tank [mole]
+        T_H2_comp : Compressor Hydrogen Temperature [K]
+        
+        Output
+        ------
+        Ptank : Tank Pressure [atm] 
+        """
         Vtank = 20 * 1e3 #[liter = m^3 * 1e3]
         A0 = 0.1975 # [atm*liter^2/mol^2] = a4
         B0 = 0.02096 # [liter/mol] = a2
         a = -0.00506 #[liter/mol] = a5
         b = -0.04359 #[liter/mol] = a3
         c = 0.0504*1e4 # [liter*K^3/mol] = a1
-        t = 1 #[s]
-        n = NH2_ele * t - NH2_HV * t # [mol]
-        Ptank = n**2*self.R1*T_H2_comp/Vtank**2*(1-c*n/Vtank/T_H2_comp**3)*(Vtank/n+B0*(1-b*n/Vtank)) \
-        - A0*(1-a*n/Vtank)*n**2/Vtank**2 # [atm]
-        return n
+        n2_V2 = n*n/(Vtank*Vtank)
+        Ptank = n2_V2*self.R1*T_H2_comp*(1-c*n/Vtank/(T_H2_comp*T_H2_comp*T_H2_comp))*(Vtank/n+B0*(1-b*n/Vtank)) \
+        - A0*(1-a*n/Vtank)*n2_V2 # [atm]
+        return Ptank
     
 def Hydrogen_Storage_System(NH2_ele, NH2_HV, P_H2_ele, T_H2_ele):
     Mode = H2System(NH2_ele, NH2_HV, P_H2_ele, T_H2_ele)
@@ -102,19 +99,15 @@ def Hydrogen_Storage_System(NH2_ele, NH2_HV, P_H2_ele, T_H2_ele):
     return output
 
 # Example
-filepath_mac = '/Users/jeonseungchan/OneDrive/OneDrive - 한양대학교/3. Codes/1. DataSet/5. KETI_Example_Data'
-filepath = 'C:/Users/jsc95/OneDrive - 한양대학교/3. Codes/1. DataSet/3. 2021_KIEE_Data'
-filename = ['Hydrogen','Vehicle','P_operate','T_operate']
-filepath = filepath_mac # MAC 사용 시 ON
+def _demo():
+    filepath_mac = '/Users/jeonseungchan/OneDrive/OneDrive - 한양대학교/3. Codes/1. DataSet/5. KETI_Example_Data'
+    filepath = 'C:/Users/jsc95/OneDrive - 한양대학교/3. Codes/1. DataSet/3. 2021_KIEE_Data'
+    filename = ['Hydrogen','Vehicle','P_operate','T_operate']
+    filepath = filepath_mac # MAC 사용 시 ON
 
-df_Hydrogen = pd.read_csv(os.path.join(filepath, "%s.csv" %filename[0]))
-df_Vehicle = pd.read_csv(os.path.join(filepath, "%s.csv" %filename[1]))
-df_P = pd.read_csv(os.path.join(filepath, "%s.csv" %filename[2]))
-df_T = pd.read_csv(os.path.join(filepath, "%s.csv" %filename[3]))
+    Hydrogen, Vehicle, P, T = read_csv_columns(filepath, filename)
 
-Hydrogen = df_Hydrogen.values
-Vehicle = df_Vehicle.values
-P = df_P.values
-T = df_T.values
+    return Hydrogen_Storage_System(Hydrogen,Vehicle,P,T)
 
-H2 = Hydrogen_Storage_System(Hydrogen,Vehicle,P,T)
\ No newline at end of file
+if __name__ == '__main__':
+    H2 = _demo()